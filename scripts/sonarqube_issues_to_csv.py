@@ -9,22 +9,56 @@ Usage:
     python sonarqube_issues_to_csv.py [--sonar-url URL] [--token TOKEN] [--output FILE]
 
 Requirements:
-    pip install requests pandas
+    pip install aiohttp pandas
+    pip install orjson  # optional, faster JSON decoding of API responses
 """
 
 import argparse
-import csv
+import asyncio
+import base64
 import json
+import math
+import re
 import sys
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional
-import requests
+from typing import Dict, Generator, Iterable, Iterator, List, Optional, Set, Tuple
+import aiohttp
 import pandas as pd
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Constants for file extensions
 EXCEL_EXTENSION = '.xlsx'
 CSV_EXTENSION = '.csv'
 
+# Columns written to CSV/Excel exports, in output order
+CSV_COLUMNS = [
+    'key', 'rule', 'severity', 'type', 'component', 'project', 'file_path', 'line',
+    'message', 'status', 'effort', 'debt', 'author', 'tags',
+    'creationDate', 'updateDate', 'closeDate'
+]
+DATE_COLUMNS = ['creationDate', 'updateDate', 'closeDate']
+
+# Trailing UTC offset ('Z', '+0200', '-05:00', '+02') of an ISO 8601 date-time
+_ISO_OFFSET_RE = re.compile(r'(T[\d:.]+)(?:Z|[+-]\d{2}(?::?\d{2})?)$')
+
+# Upper bound on in-flight page requests, to stay within SonarQube rate limits
+MAX_CONCURRENT_PAGES = 16
+
+# SonarQube only pages through the first 10,000 results of a search
+SEARCH_RESULT_LIMIT = 10000
+
+# Transient HTTP statuses retried with exponential backoff, along with
+# connection errors and timeouts
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.3
+
 
 class SonarQubeIssuesExporter:
     """Exports SonarQube issues to CSV format."""
@@ -43,65 +77,252 @@ class SonarQubeIssuesExporter:
         self.token = token
         self.project_key = project_key
         self.organization_key = organization_key
-        self.session = requests.Session()
-        self.session.auth = (token, '')
+        # SonarQube takes the token as the basic-auth user with an empty password
+        credentials = base64.b64encode(f"{token}:".encode()).decode()
+        self.headers = {
+            'Authorization': f"Basic {credentials}",
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+        }
         
-    def get_issues(self, page_size: int = 500) -> List[Dict]:
+    async def _fetch_page(self, session: aiohttp.ClientSession, page: int, page_size: int,
+                          created_after: Optional[str] = None) -> Dict:
         """
-        Fetch all open issues from SonarQube.
+        Fetch a single page of open issues.
         
         Args:
+            session: Open aiohttp session
+            page: 1-based page number
             page_size: Number of issues per page
+            created_after: Only include issues created at or after this date
             
         Returns:
-            List of issue dictionaries
+            Decoded JSON response for the page
         """
-        issues = []
-        page = 1
+        url = f"{self.sonar_url}/api/issues/search"
+        # No facets: they are not exported and SonarQube recomputes them on
+        # every page. A fixed sort order keeps pages stable while paging.
+        params = {
+            'componentKeys': self.project_key,
+            'organization': self.organization_key,
+            'statuses': 'OPEN',
+            'ps': page_size,
+            'p': page,
+            's': 'CREATION_DATE',
+            'asc': 'true'
+        }
+        if created_after:
+            params['createdAfter'] = created_after
         
-        print(f"Fetching issues for project: {self.project_key}")
-        print(f"Organization: {self.organization_key}")
+        # Retry transient statuses, connection failures and timeouts alike
+        for attempt in range(MAX_RETRIES + 1):
+            last_attempt = attempt == MAX_RETRIES
+            try:
+                async with session.get(url, params=params) as response:
+                    if last_attempt or response.status not in RETRY_STATUSES:
+                        response.raise_for_status()
+                        return _json_loads(await response.read())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if last_attempt:
+                    raise
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+    
+    async def _fetch_pages(self, session: aiohttp.ClientSession, pages: range, page_size: int,
+                           created_after: Optional[str] = None) -> List:
+        """
+        Fetch a batch of pages concurrently.
         
-        while True:
-            url = f"{self.sonar_url}/api/issues/search"
-            params = {
-                'componentKeys': self.project_key,
-                'organization': self.organization_key,
-                'statuses': 'OPEN',
-                'ps': page_size,
-                'p': page,
-                'facets': 'severities,types,rules'
-            }
+        Args:
+            session: Open aiohttp session
+            pages: Page numbers to fetch
+            page_size: Number of issues per page
+            created_after: Only include issues created at or after this date
             
-            try:
-                response = self.session.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                if 'issues' not in data:
-                    print(f"Warning: No 'issues' field in response: {data}")
-                    break
+        Returns:
+            Decoded JSON responses, or the raised exception, in page order
+        """
+        return await asyncio.gather(
+            *(self._fetch_page(session, page, page_size, created_after) for page in pages),
+            return_exceptions=True
+        )
+    
+    async def _open_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session inside the event loop that will use it."""
+        # Pool one keep-alive connection per concurrent page request
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_PAGES)
+        return aiohttp.ClientSession(headers=self.headers, connector=connector)
+    
+    def _page_issues(self, page: int, data) -> Optional[List[Dict]]:
+        """
+        Extract the issues from a fetched page.
+        
+        Args:
+            page: 1-based page number
+            data: Decoded JSON response, or the exception raised fetching it
+            
+        Returns:
+            List of issues on the page, or None if paging should stop
+        """
+        # ValueError covers bodies that are not JSON (json and orjson decode errors)
+        if isinstance(data, (aiohttp.ClientError, asyncio.TimeoutError, ValueError)):
+            print(f"Error fetching issues: {data}")
+            return None
+        if isinstance(data, BaseException):
+            raise data
+        
+        if 'issues' not in data:
+            print(f"Warning: No 'issues' field in response: {data}")
+            return None
+            
+        page_issues = data['issues']
+        if not page_issues:
+            return None
+            
+        print(f"Fetched page {page}: {len(page_issues)} issues")
+        return page_issues
+    
+    def _iter_window(self, loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession,
+                     page_size: int, created_after: Optional[str],
+                     skip_keys: Set[str]) -> Generator[List[Dict], None, Optional[Tuple]]:
+        """
+        Yield the pages of one search, capped at SEARCH_RESULT_LIMIT results.
+        
+        Page 1 is fetched alone to learn the total; the remaining pages are
+        fetched in concurrent batches of MAX_CONCURRENT_PAGES.
+        
+        Args:
+            loop: Event loop that owns the session
+            session: Open aiohttp session
+            page_size: Number of issues per page
+            created_after: Only include issues created at or after this date
+            skip_keys: Issue keys already yielded by the previous window
+            
+        Returns:
+            (total, last creation date, keys created at that date), or None
+            if paging stopped early
+        """
+        total = 0
+        last_date = created_after
+        last_keys = set()
+        start = 1
+        n_pages = 1
+        while start <= n_pages:
+            pages = range(start, min(start + MAX_CONCURRENT_PAGES, n_pages + 1))
+            results = loop.run_until_complete(self._fetch_pages(session, pages, page_size, created_after))
+            
+            # Keep the serial semantics: stop at the first failed or empty page
+            for page, data in zip(pages, results):
+                page_issues = self._page_issues(page, data)
+                if page_issues is None:
+                    return None
+                if page == 1:
+                    total = data.get('paging', {}).get('total', data.get('total', 0))
+                    # Never ask for a page that reaches past the result limit
+                    n_pages = min(math.ceil(total / page_size), SEARCH_RESULT_LIMIT // page_size)
                     
-                page_issues = data['issues']
-                if not page_issues:
-                    break
+                # Issues arrive sorted by creation date, so the last one seen
+                # is where the next window starts
+                for issue in page_issues:
+                    if issue.get('creationDate') != last_date:
+                        last_date = issue.get('creationDate')
+                        last_keys = set()
+                    last_keys.add(issue.get('key'))
                     
-                issues.extend(page_issues)
-                print(f"Fetched page {page}: {len(page_issues)} issues")
-                
-                # Check if we've reached the end
-                total = data.get('total', 0)
-                if len(issues) >= total:
-                    break
+                if skip_keys:
+                    page_issues = [issue for issue in page_issues if issue.get('key') not in skip_keys]
+                if page_issues:
+                    yield page_issues
                     
-                page += 1
-                
-            except requests.exceptions.RequestException as e:
-                print(f"Error fetching issues: {e}")
-                break
+            start = pages.stop
+            
+        return total, last_date, last_keys
+    
+    def _iter_windows(self, loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession,
+                      page_size: int) -> Iterator[List[Dict]]:
+        """
+        Yield all pages, splitting the search into createdAfter windows when
+        it has more results than SonarQube will page through.
+        
+        Args:
+            loop: Event loop that owns the session
+            session: Open aiohttp session
+            page_size: Number of issues per page
+            
+        Yields:
+            Lists of issue dictionaries, in creation date order
+        """
+        created_after = None
+        skip_keys = set()
+        while True:
+            window = yield from self._iter_window(loop, session, page_size, created_after, skip_keys)
+            if window is None:
+                return
+            total, last_date, last_keys = window
+            if total <= SEARCH_RESULT_LIMIT:
+                return
+            if last_date == created_after:
+                print(f"Warning: More than {SEARCH_RESULT_LIMIT} issues created at {last_date}, "
+                      "remaining issues skipped")
+                return
                 
-        print(f"Total issues fetched: {len(issues)}")
-        return issues
+            # createdAfter is inclusive, so skip issues already seen at the boundary
+            created_after = last_date
+            skip_keys = last_keys
+    
+    def iter_issue_pages(self, page_size: int = 500) -> Iterator[List[Dict]]:
+        """
+        Fetch open issues from SonarQube, yielding one page at a time.
+        
+        Pages are fetched in concurrent batches of MAX_CONCURRENT_PAGES, so
+        at most one batch of issues is held in memory. Results beyond
+        SonarQube's SEARCH_RESULT_LIMIT are read in createdAfter windows.
+        
+        Args:
+            page_size: Number of issues per page
+            
+        Yields:
+            Lists of issue dictionaries, in creation date order
+        """
+        print(f"Fetching issues for project: {self.project_key}")
+        print(f"Organization: {self.organization_key}")
+        
+        fetched = 0
+        loop = asyncio.new_event_loop()
+        session = loop.run_until_complete(self._open_session())
+        try:
+            for page_issues in self._iter_windows(loop, session, page_size):
+                fetched += len(page_issues)
+                yield page_issues
+        finally:
+            loop.run_until_complete(session.close())
+            loop.close()
+            
+        print(f"Total issues fetched: {fetched}")
+    
+    def iter_issues(self, page_size: int = 500) -> Iterator[Dict]:
+        """
+        Fetch open issues from SonarQube, yielding one issue at a time.
+        
+        Args:
+            page_size: Number of issues per page
+            
+        Yields:
+            Issue dictionaries
+        """
+        for page_issues in self.iter_issue_pages(page_size):
+            yield from page_issues
+    
+    def get_issues(self, page_size: int = 500) -> List[Dict]:
+        """
+        Fetch all open issues from SonarQube.
+        
+        Args:
+            page_size: Number of issues per page
+            
+        Returns:
+            List of issue dictionaries
+        """
+        return list(self.iter_issues(page_size))
     
     def format_issue_for_csv(self, issue: Dict) -> Dict:
         """
@@ -145,7 +366,7 @@ class SonarQubeIssuesExporter:
             formatted['file_path'] = ''
             
         # Format dates
-        for date_field in ['creationDate', 'updateDate', 'closeDate']:
+        for date_field in DATE_COLUMNS:
             if formatted[date_field]:
                 try:
                     # Convert ISO date to readable format
@@ -156,6 +377,39 @@ class SonarQubeIssuesExporter:
                     
         return formatted
     
+    def format_issues_frame(self, issues: List[Dict]) -> pd.DataFrame:
+        """
+        Format a batch of SonarQube issues column-wise.
+        
+        Produces the same values as format_issue_for_csv, but converts whole
+        columns at once instead of one issue at a time.
+        
+        Args:
+            issues: List of raw issue dictionaries from SonarQube API
+            
+        Returns:
+            DataFrame with one row per issue and CSV_COLUMNS as columns
+        """
+        # object dtype keeps integer line numbers from being widened to float
+        raw_columns = [c for c in CSV_COLUMNS if c != 'file_path']
+        df = pd.DataFrame(issues, columns=raw_columns, dtype=object)
+        
+        df['tags'] = df['tags'].str.join(',')
+        df = df.astype(object).where(df.notna(), '')
+        
+        # Remove project key prefix to get relative file path
+        df['file_path'] = df['component'].str.removeprefix(self.project_key + ':')
+        
+        # Convert ISO dates to readable format, keeping values that fail to parse.
+        # The UTC offset is dropped first so the local wall time is kept, as
+        # format_issue_for_csv does, rather than converting to UTC.
+        for date_field in DATE_COLUMNS:
+            wall_time = df[date_field].str.replace(_ISO_OFFSET_RE, r'\1', regex=True)
+            parsed = pd.to_datetime(wall_time, format='ISO8601', errors='coerce')
+            df[date_field] = parsed.dt.strftime('%Y-%m-%d %H:%M:%S').where(parsed.notna(), df[date_field])
+        
+        return df[CSV_COLUMNS]
+    
     def export_to_csv(self, issues: List[Dict], output_file: str):
         """
         Export issues to CSV file.
@@ -169,56 +423,125 @@ class SonarQubeIssuesExporter:
             return
             
         # Format issues for CSV
-        formatted_issues = [self.format_issue_for_csv(issue) for issue in issues]
-        
-        # Define CSV columns
-        columns = [
-            'key', 'rule', 'severity', 'type', 'component', 'project', 'file_path', 'line',
-            'message', 'status', 'effort', 'debt', 'author', 'tags',
-            'creationDate', 'updateDate', 'closeDate'
-        ]
+        df = self.format_issues_frame(issues)
         
-        # Write to CSV
+        # Write to CSV (same line endings as csv.DictWriter)
         try:
             with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=columns)
-                writer.writeheader()
-                writer.writerows(formatted_issues)
+                df.to_csv(csvfile, index=False, lineterminator='\r\n')
                 
-            print(f"Successfully exported {len(formatted_issues)} issues to {output_file}")
+            print(f"Successfully exported {len(df)} issues to {output_file}")
             
         except IOError as e:
             print(f"Error writing CSV file: {e}")
             sys.exit(1)
     
-    def export_to_excel(self, issues: List[Dict], output_file: str):
+    def export_stream(self, output_file: str, pages: Optional[Iterable[List[Dict]]] = None) -> int:
         """
-        Export issues to Excel file using pandas.
+        Export issues to CSV file as they are fetched.
+        
+        Each page is formatted and appended on its own, so memory use is
+        bounded by the page size rather than the number of issues. The file
+        is only created once the first issue arrives.
         
         Args:
-            issues: List of issue dictionaries
-            output_file: Output Excel file path
+            output_file: Output CSV file path
+            pages: Iterable of issue pages (default: iter_issue_pages())
+            
+        Returns:
+            Number of issues exported
         """
-        if not issues:
-            print("No issues to export")
-            return
+        if pages is None:
+            pages = self.iter_issue_pages()
             
+        exported = 0
+        csvfile = None
         try:
-            # Format issues for Excel
-            formatted_issues = [self.format_issue_for_csv(issue) for issue in issues]
-            
-            # Create DataFrame
-            df = pd.DataFrame(formatted_issues)
+            for page_issues in pages:
+                if csvfile is None:
+                    csvfile = open(output_file, 'w', newline='', encoding='utf-8')
+                df = self.format_issues_frame(page_issues)
+                df.to_csv(csvfile, index=False, header=exported == 0, lineterminator='\r\n')
+                exported += len(df)
+                
+        except IOError as e:
+            print(f"Error writing CSV file: {e}")
+            sys.exit(1)
+        finally:
+            if csvfile is not None:
+                csvfile.close()
+                
+        if exported:
+            print(f"Successfully exported {exported} issues to {output_file}")
+        return exported
+    
+    def export_stream_excel(self, output_file: str, pages: Optional[Iterable[List[Dict]]] = None) -> int:
+        """
+        Export issues to Excel file as they are fetched.
+        
+        Rows are appended to a write-only openpyxl workbook page by page,
+        so the whole export is never held in a DataFrame. The workbook is
+        only created once the first issue arrives. Control characters that
+        Excel cannot store are removed. Falls back to CSV if openpyxl is not
+        available.
+        
+        Args:
+            output_file: Output Excel file path
+            pages: Iterable of issue pages (default: iter_issue_pages())
             
-            # Write to Excel
-            df.to_excel(output_file, index=False, engine='openpyxl')
-            print(f"Successfully exported {len(formatted_issues)} issues to {output_file}")
+        Returns:
+            Number of issues exported
+        """
+        if pages is None:
+            pages = self.iter_issue_pages()
             
-        except Exception as e:
+        try:
+            from openpyxl import Workbook
+            from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+        except ImportError as e:
             print(f"Error writing Excel file: {e}")
             print("Falling back to CSV export...")
             csv_file = output_file.replace(EXCEL_EXTENSION, CSV_EXTENSION)
-            self.export_to_csv(issues, csv_file)
+            return self.export_stream(csv_file, pages)
+            
+        exported = 0
+        workbook = None
+        for page_issues in pages:
+            if workbook is None:
+                workbook = Workbook(write_only=True)
+                sheet = workbook.create_sheet('Sheet1')
+                sheet.append(CSV_COLUMNS)
+            df = self.format_issues_frame(page_issues)
+            df = df.replace(ILLEGAL_CHARACTERS_RE, '', regex=True)
+            for row in df.itertuples(index=False, name=None):
+                sheet.append(row)
+            exported += len(df)
+            
+        if workbook is None:
+            return 0
+            
+        try:
+            workbook.save(output_file)
+        except IOError as e:
+            print(f"Error writing Excel file: {e}")
+            sys.exit(1)
+            
+        print(f"Successfully exported {exported} issues to {output_file}")
+        return exported
+    
+    def export_to_excel(self, issues: List[Dict], output_file: str):
+        """
+        Export issues to Excel file.
+        
+        Args:
+            issues: List of issue dictionaries
+            output_file: Output Excel file path
+        """
+        if not issues:
+            print("No issues to export")
+            return
+            
+        self.export_stream_excel(output_file, [issues])
 
 
 def main():
@@ -281,23 +604,32 @@ Examples:
         organization_key=args.organization_key
     )
     
-    # Fetch issues
-    print("Fetching SonarQube issues...")
-    issues = exporter.get_issues()
+    # Count by severity and type while the pages stream through
+    severity_counts = Counter()
+    type_counts = Counter()
     
-    if not issues:
-        print("No open issues found in the project")
-        return
+    def tally(pages: Iterable[List[Dict]]) -> Iterator[List[Dict]]:
+        for page_issues in pages:
+            severity_counts.update(issue.get('severity', 'UNKNOWN') for issue in page_issues)
+            type_counts.update(issue.get('type', 'UNKNOWN') for issue in page_issues)
+            yield page_issues
+    
+    # Fetch and export issues
+    print("Fetching SonarQube issues...")
+    pages = tally(exporter.iter_issue_pages())
     
-    # Export to file
     if args.format == 'excel':
         if not args.output.endswith(EXCEL_EXTENSION):
             args.output = args.output.replace(CSV_EXTENSION, EXCEL_EXTENSION)
-        exporter.export_to_excel(issues, args.output)
+        total_issues = exporter.export_stream_excel(args.output, pages)
     else:
         if not args.output.endswith(CSV_EXTENSION):
             args.output = args.output.replace(EXCEL_EXTENSION, CSV_EXTENSION)
-        exporter.export_to_csv(issues, args.output)
+        total_issues = exporter.export_stream(args.output, pages)
+    
+    if not total_issues:
+        print("No open issues found in the project")
+        return
     
     # Print summary
     print("\n" + "="*50)
@@ -305,18 +637,9 @@ Examples:
     print("="*50)
     print(f"Project: {args.project_key}")
     print(f"Organization: {args.organization_key}")
-    print(f"Total Issues: {len(issues)}")
+    print(f"Total Issues: {total_issues}")
     print(f"Output File: {args.output}")
     
-    # Count by severity
-    severity_counts = {}
-    type_counts = {}
-    for issue in issues:
-        severity = issue.get('severity', 'UNKNOWN')
-        issue_type = issue.get('type', 'UNKNOWN')
-        severity_counts[severity] = severity_counts.get(severity, 0) + 1
-        type_counts[issue_type] = type_counts.get(issue_type, 0) + 1
-    
     print(f"\nIssues by Severity:")
     for severity, count in sorted(severity_counts.items()):
         print(f"  {severity}: {count}")
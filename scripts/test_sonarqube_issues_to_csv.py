@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for sonarqube_issues_to_csv.py
+
+Checks that the column-wise formatter produces the same values as the
+per-issue formatter, and that exports handle awkward issue content.
+
+Usage:
+    python -m unittest test_sonarqube_issues_to_csv
+"""
+
+import os
+import tempfile
+import unittest
+
+from sonarqube_issues_to_csv import CSV_COLUMNS, SonarQubeIssuesExporter
+
+
+class FormatIssuesFrameTest(unittest.TestCase):
+    """Compares format_issues_frame with format_issue_for_csv."""
+
+    def setUp(self):
+        self.exporter = SonarQubeIssuesExporter('http://localhost', 'token', 'Proj', 'org')
+
+    def assert_matches_row_formatter(self, issues):
+        df = self.exporter.format_issues_frame(issues)
+        self.assertEqual(list(df.columns), CSV_COLUMNS)
+        self.assertEqual(len(df), len(issues))
+        for issue, (_, row) in zip(issues, df.iterrows()):
+            expected = self.exporter.format_issue_for_csv(issue)
+            for column in CSV_COLUMNS:
+                self.assertEqual(row[column], expected[column], f"{column} of {issue}")
+
+    def test_non_utc_offsets_keep_local_wall_time(self):
+        self.assert_matches_row_formatter([
+            {'key': 'a', 'creationDate': '2023-01-15T10:30:00+0200'},
+            {'key': 'b', 'creationDate': '2023-01-15T10:30:00-05:00'},
+            {'key': 'c', 'creationDate': '2023-01-15T23:59:59+0530'},
+            {'key': 'd', 'creationDate': '2023-01-15T10:30:00.250+02:00'},
+        ])
+        df = self.exporter.format_issues_frame([{'creationDate': '2023-01-15T10:30:00+0200'}])
+        self.assertEqual(df['creationDate'][0], '2023-01-15 10:30:00')
+
+    def test_utc_designators(self):
+        self.assert_matches_row_formatter([
+            {'key': 'a', 'creationDate': '2023-01-15T10:30:00Z'},
+            {'key': 'b', 'updateDate': '2023-01-15T10:30:00+0000'},
+            {'key': 'c', 'closeDate': '2023-01-15T10:30:00+00:00'},
+            {'key': 'd', 'creationDate': '2023-01-15'},
+        ])
+
+    def test_missing_values(self):
+        self.assert_matches_row_formatter([
+            {},
+            {'key': 'a', 'line': 12, 'tags': []},
+            {'key': 'b', 'component': 'Proj:src/main.cpp', 'tags': ['x', 'y']},
+            {'key': 'c', 'component': 'Other:src/main.cpp', 'effort': '5min'},
+        ])
+
+    def test_garbage_dates_are_kept(self):
+        self.assert_matches_row_formatter([
+            {'key': 'a', 'creationDate': 'garbage'},
+            {'key': 'b', 'updateDate': 'not-a-dateT10:30+0200'},
+            {'key': 'c', 'closeDate': '2023-13-45T99:00:00Z'},
+        ])
+
+    def test_empty_batch(self):
+        df = self.exporter.format_issues_frame([])
+        self.assertEqual(list(df.columns), CSV_COLUMNS)
+        self.assertEqual(len(df), 0)
+
+
+class ExportStreamExcelTest(unittest.TestCase):
+    """Checks the streaming Excel export."""
+
+    def test_illegal_characters_are_removed(self):
+        from openpyxl import load_workbook
+
+        exporter = SonarQubeIssuesExporter('http://localhost', 'token', 'Proj', 'org')
+        with tempfile.TemporaryDirectory() as tmp:
+            output_file = os.path.join(tmp, 'issues.xlsx')
+            exported = exporter.export_stream_excel(
+                output_file, [[{'key': 'a', 'line': 3, 'message': 'bell\x07 here'}]])
+
+            self.assertEqual(exported, 1)
+            sheet = load_workbook(output_file).active
+            row = dict(zip(CSV_COLUMNS, (cell.value for cell in sheet[2])))
+            self.assertEqual(row['message'], 'bell here')
+            self.assertEqual(row['line'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,22 +8,45 @@ This script validates SBOMs using online validation services and APIs.
 import json
 import sys
 import os
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Header fields every SPDX tag-value document must contain, in header order
+_SPDX_REQUIRED_ORDER = ('SPDXVersion', 'DataLicense', 'DocumentName', 'DocumentNamespace')
+
+# Serializes per-file reports when files are validated in parallel
+_print_lock = threading.Lock()
+
 def validate_cyclonedx_json_schema(sbom_content: str) -> Tuple[bool, List[str]]:
     """
     Validate CycloneDX JSON against the official schema.
     This is a basic validation - for full validation, use the official tools.
     """
+    _, errors = _parse_and_validate_cyclonedx(sbom_content)
+    return len(errors) == 0, errors
+
+def _parse_and_validate_cyclonedx(sbom_content: str) -> Tuple[Optional[Dict], List[str]]:
+    """
+    Parse CycloneDX JSON once and validate it.
+    Returns the parsed document (None if it is not valid JSON) so callers
+    can reuse it without parsing again.
+    """
     errors = []
     
     try:
-        data = json.loads(sbom_content)
+        data = _json_loads(sbom_content)
     except json.JSONDecodeError as e:
         errors.append(f"Invalid JSON: {e}")
-        return False, errors
+        return None, errors
     
     # Check required top-level fields
     required_fields = ['bomFormat', 'specVersion', 'version', 'metadata', 'components']
@@ -64,53 +87,56 @@ def validate_cyclonedx_json_schema(sbom_content: str) -> Tuple[bool, List[str]]:
                 elif 'name' not in component:
                     errors.append(f"Component {i} missing required 'name' field")
     
-    return len(errors) == 0, errors
+    return data, errors
 
 def validate_spdx_structure(spdx_content: str) -> Tuple[bool, List[str]]:
     """
     Validate SPDX structure and required fields.
     """
     errors = []
-    lines = spdx_content.split('\n')
     
-    # Check for required header fields
-    required_fields = ['SPDXVersion', 'DataLicense', 'DocumentName', 'DocumentNamespace']
     found_fields = set()
+    version = None
+    has_packages = False
+    has_files = False
     
-    for line in lines:
-        line = line.strip()
-        if ':' in line:
-            field = line.split(':', 1)[0].strip()
-            found_fields.add(field)
+    # Collect everything the checks below need in a single pass over the lines
+    for line in spdx_content.splitlines():
+        field, sep, value = line.strip().partition(':')
+        if not sep:
+            continue
+        field = field.strip()
+        found_fields.add(field)
+        if field == 'SPDXVersion' and version is None:
+            version = value.strip()
+        elif field == 'PackageName':
+            has_packages = True
+        elif field == 'FileName':
+            has_files = True
     
-    for field in required_fields:
+    # Check for required header fields
+    for field in _SPDX_REQUIRED_ORDER:
         if field not in found_fields:
             errors.append(f"Missing required SPDX field: {field}")
     
     # Check SPDX version
-    for line in lines:
-        if line.startswith('SPDXVersion:'):
-            version = line.split(':', 1)[1].strip()
-            if not version.startswith('SPDX-'):
-                errors.append(f"Invalid SPDX version format: {version}")
-            break
+    if version is not None and not version.startswith('SPDX-'):
+        errors.append(f"Invalid SPDX version format: {version}")
     
     # Check for package or file information (both are valid SPDX formats)
-    has_packages = any('PackageName:' in line for line in lines)
-    has_files = any('FileName:' in line for line in lines)
     if not has_packages and not has_files:
         errors.append("No package or file information found")
     
     return len(errors) == 0, errors
 
-def validate_with_cyclonedx_tool_center(sbom_file: Path) -> Dict:
+def validate_with_cyclonedx_tool_center(sbom_file: Path, report: List[str]) -> Dict:
     """
     Simulate validation with CycloneDX Tool Center.
     In a real implementation, this would use their API.
     """
-    print(f"  Validating with CycloneDX Tool Center: {sbom_file.name}")
-    print(f"    Manual validation URL: https://cyclonedx.org/tool-center/")
-    print(f"    Upload your file: {sbom_file} to the tool center")
+    report.append(f"  Validating with CycloneDX Tool Center: {sbom_file.name}")
+    report.append(f"    Manual validation URL: https://cyclonedx.org/tool-center/")
+    report.append(f"    Upload your file: {sbom_file} to the tool center")
     
     return {
         'validated': False,
@@ -118,14 +144,14 @@ def validate_with_cyclonedx_tool_center(sbom_file: Path) -> Dict:
         'url': 'https://cyclonedx.org/tool-center/'
     }
 
-def validate_with_spdx_tools(sbom_file: Path) -> Dict:
+def validate_with_spdx_tools(sbom_file: Path, report: List[str]) -> Dict:
     """
     Simulate validation with SPDX Tools.
     In a real implementation, this would use their API.
     """
-    print(f"  Validating with SPDX Tools: {sbom_file.name}")
-    print(f"    Manual validation URL: https://tools.spdx.org/app/validate/")
-    print(f"    Upload your file: {sbom_file} to the SPDX validator")
+    report.append(f"  Validating with SPDX Tools: {sbom_file.name}")
+    report.append(f"    Manual validation URL: https://tools.spdx.org/app/validate/")
+    report.append(f"    Upload your file: {sbom_file} to the SPDX validator")
     
     return {
         'validated': False,
@@ -133,16 +159,49 @@ def validate_with_spdx_tools(sbom_file: Path) -> Dict:
         'url': 'https://tools.spdx.org/app/validate/'
     }
 
+def _check_cyclonedx(content: str) -> Tuple[List[str], str]:
+    """
+    Run the CycloneDX checks, returning the errors and a short summary.
+    """
+    data, errors = _parse_and_validate_cyclonedx(content)
+    if errors:
+        return errors, ""
+    return errors, f"components: {len(data['components'])}"
+
+def _check_spdx(content: str) -> Tuple[List[str], str]:
+    """
+    Run the SPDX checks, returning the errors and a short summary.
+    """
+    _, errors = validate_spdx_structure(content)
+    return errors, ""
+
+# File suffix -> (structural check, online validator, report label)
+_VALIDATORS = {
+    '.json': (_check_cyclonedx, validate_with_cyclonedx_tool_center, 'CycloneDX JSON schema'),
+    '.spdx': (_check_spdx, validate_with_spdx_tools, 'SPDX structure'),
+}
+
 def validate_sbom_file(sbom_file: Path) -> Dict:
     """
     Validate a single SBOM file.
+    The report for the file is printed as one block, so it is safe to call
+    from several threads at once.
     """
-    print(f"\n=== Validating: {sbom_file.name} ===")
-    
+    report = [f"\n=== Validating: {sbom_file.name} ==="]
+    try:
+        return _validate_sbom_file(sbom_file, report)
+    finally:
+        with _print_lock:
+            print("\n".join(report))
+
+def _validate_sbom_file(sbom_file: Path, report: List[str]) -> Dict:
+    """
+    Validate a single SBOM file, appending progress lines to report.
+    """
+    # Decode in one call rather than through a buffered text wrapper
     try:
-        with open(sbom_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
+        content = sbom_file.read_bytes().decode('utf-8')
+    except (OSError, UnicodeDecodeError) as e:
         return {
             'file': str(sbom_file),
             'valid': False,
@@ -157,37 +216,24 @@ def validate_sbom_file(sbom_file: Path) -> Dict:
     }
     
     # Validate based on file type
-    if sbom_file.suffix == '.json':
-        # CycloneDX JSON validation
-        valid, errors = validate_cyclonedx_json_schema(content)
-        result['valid'] = valid
-        result['errors'].extend(errors)
-        
-        if valid:
-            print(f"  ✓ CycloneDX JSON schema validation: PASSED")
-        else:
-            print(f"  ✗ CycloneDX JSON schema validation: FAILED")
-            for error in errors:
-                print(f"    Error: {error}")
-        
-        # Online validation
-        validate_with_cyclonedx_tool_center(sbom_file)
-        
-    elif sbom_file.suffix == '.spdx':
-        # SPDX validation
-        valid, errors = validate_spdx_structure(content)
-        result['valid'] = valid
-        result['errors'].extend(errors)
-        
-        if valid:
-            print(f"  ✓ SPDX structure validation: PASSED")
-        else:
-            print(f"  ✗ SPDX structure validation: FAILED")
-            for error in errors:
-                print(f"    Error: {error}")
-        
-        # Online validation
-        validate_with_spdx_tools(sbom_file)
+    entry = _VALIDATORS.get(sbom_file.suffix)
+    if entry is None:
+        return result
+    validator, online_validator, label = entry
+    
+    errors, summary = validator(content)
+    result['valid'] = not errors
+    result['errors'].extend(errors)
+    
+    if not errors:
+        report.append(f"  ✓ {label} validation: PASSED" + (f" ({summary})" if summary else ""))
+    else:
+        report.append(f"  ✗ {label} validation: FAILED")
+        for error in errors:
+            report.append(f"    Error: {error}")
+    
+    # Online validation
+    online_validator(sbom_file, report)
     
     return result
 
@@ -222,17 +268,12 @@ def main():
     
     print(f"Found {len(sbom_files)} SBOM files to validate.")
     
-    # Validate each file
-    results = []
+    # Validate files in parallel; the work is file and (eventually) network I/O
     total_files = len(sbom_files)
-    valid_files = 0
-    
-    for sbom_file in sbom_files:
-        result = validate_sbom_file(sbom_file)
-        results.append(result)
-        
-        if result['valid']:
-            valid_files += 1
+    with ThreadPoolExecutor(max_workers=min(32, total_files)) as executor:
+        results = list(executor.map(validate_sbom_file, sbom_files))
+    
+    valid_files = sum(1 for result in results if result['valid'])
     
     # Summary
     print("\n" + "=" * 40)
@@ -3,10 +3,24 @@
 Installation script for Heimdall Profiling Visualizer dependencies
 """
 
+import importlib.util
+import shutil
 import subprocess
 import sys
 import os
 
+_SUCCESS_MSG = """✅ Dependencies installed successfully!
+
+You can now use the visualizer:
+  python tools/profiling_visualizer.py <json_file>
+
+Example:
+  python tools/profiling_visualizer.py heimdall_benchmark_results.json"""
+
+_ERROR_HELP = """
+You can try installing manually:
+  pip install matplotlib seaborn pandas numpy"""
+
 def install_requirements():
     """Install required Python packages for the visualizer."""
     print("Installing Heimdall Profiling Visualizer dependencies...")
@@ -15,21 +29,27 @@ def install_requirements():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     requirements_file = os.path.join(script_dir, "requirements.txt")
     
+    # Prefer uv's resolver when available, otherwise fall back to pip
+    uv = shutil.which("uv")
+    if uv:
+        install_cmd = [
+            uv, "pip", "install", "-r", requirements_file,
+            "--python", sys.executable
+        ]
+    else:
+        install_cmd = [
+            sys.executable, "-m", "pip", "install", "-r", requirements_file,
+            "--disable-pip-version-check", "--no-input", "--prefer-binary"
+        ]
+    
     try:
         # Install requirements
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "-r", requirements_file
-        ])
-        print("✅ Dependencies installed successfully!")
-        print("\nYou can now use the visualizer:")
-        print("  python tools/profiling_visualizer.py <json_file>")
-        print("\nExample:")
-        print("  python tools/profiling_visualizer.py heimdall_benchmark_results.json")
+        subprocess.check_call(install_cmd)
+        print(_SUCCESS_MSG)
         
     except subprocess.CalledProcessError as e:
         print(f"❌ Error installing dependencies: {e}")
-        print("\nYou can try installing manually:")
-        print("  pip install matplotlib seaborn pandas numpy")
+        print(_ERROR_HELP)
         sys.exit(1)
     except FileNotFoundError:
         print("❌ pip not found. Please install pip first.")
@@ -38,13 +58,11 @@ def install_requirements():
 def check_dependencies():
     """Check if all required packages are already installed."""
     required_packages = ['matplotlib', 'seaborn', 'pandas', 'numpy']
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec only locates the package; it does not execute its __init__
+    missing_packages = [
+        package for package in required_packages
+        if importlib.util.find_spec(package) is None
+    ]
     
     if missing_packages:
         print(f"Missing packages: {', '.join(missing_packages)}")